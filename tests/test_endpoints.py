@@ -42,6 +42,42 @@ def test_http_endpoint_route():
     # assert res.text == 'Method Not Allowed'
 
 
+def test_http_endpoint_handlers():
+    class SyncPage(HttpEndPoint):
+        def get(self, req: Request):
+            return PlainTextResponse("sync")
+
+    class AsyncPage(HttpEndPoint):
+        async def get(self, req: Request):
+            return PlainTextResponse("async")
+
+        def report(self, req: Request):
+            return PlainTextResponse("report")
+
+    handlers = dict(AsyncPage._handlers)
+    for _ in range(2):
+        assert TestClient(SyncPage).get("/").text == "sync"
+        assert TestClient(AsyncPage).get("/").text == "async"
+        assert TestClient(AsyncPage).request("REPORT", "/").text == "report"
+
+        res = TestClient(AsyncPage).post("/")
+        assert res.status_code == 405
+        assert res.text == "Method Not Allowed"
+
+        for method in ("M0", "M1", "M2"):
+            res = TestClient(AsyncPage).request(method, "/")
+            assert res.status_code == 405
+    # endfor
+
+    assert AsyncPage._handlers == handlers
+
+    async def get(self, req: Request):
+        return PlainTextResponse("replaced")
+
+    SyncPage.get = get
+    assert TestClient(SyncPage).get("/").text == "replaced"
+
+
 def test_websocket_endpoint_on_connect():
     class WsApp(WebSocketEndpoint):
         async def on_connect(self, **kwargs: typing.Any) -> None:
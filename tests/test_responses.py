@@ -249,6 +249,39 @@ def test_response_ujson():
     assert res.json() == {"hello": "usjon"}
 
 
+def test_file_response_zero_copy_stale_stat(tmpdir):
+    path = os.path.join(tmpdir, "example.txt")
+    with open(path, "w") as file:
+        file.write("<file content>")
+    stat_result = os.stat(path)
+    with open(path, "w") as file:
+        file.write("<rewritten file content>")
+
+    messages = []
+
+    async def receive():
+        return {"type": "http.disconnect"}  # pragma: nocover
+
+    async def send(message):
+        if message["type"] == "http.response.zerocopysend":
+            message = dict(message, file=message["file"].read())
+        messages.append(message)
+
+    res = FileResponse(path, stat_result=stat_result, headers={"etag": "fixed"})
+    res.zero_copy = True
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(res(receive, send))
+    headers = dict(messages[0]["headers"])
+    assert headers[b"content-length"] == b"24"
+    assert headers[b"etag"] == b"fixed"
+    assert messages[1]["file"] == b"<rewritten file content>"
+
+    res = FileResponse(os.path.join(tmpdir, "404.txt"))
+    res.zero_copy = True
+    with pytest.raises(RuntimeError):
+        loop.run_until_complete(res(receive, send))
+
+
 def test_file_response_with_directory_raises_error(tmpdir):
     def app(scope):
         return FileResponse(path=tmpdir, filename="example.png")
@@ -259,6 +292,33 @@ def test_file_response_with_directory_raises_error(tmpdir):
     assert "is not a file" in str(exc)
 
 
+def test_file_response_zero_copy_with_directory_raises_error(tmpdir):
+    async def receive():
+        return {"type": "http.disconnect"}  # pragma: nocover
+
+    async def send(message):
+        raise AssertionError("nothing should be sent")  # pragma: nocover
+
+    loop = asyncio.get_event_loop()
+    res = FileResponse(path=tmpdir, filename="example.png")
+    res.zero_copy = True
+    with pytest.raises(RuntimeError) as exc:
+        loop.run_until_complete(res(receive, send))
+    assert "is not a file" in str(exc)
+
+    if not hasattr(os, "mkfifo"):
+        return  # pragma: nocover
+
+    # opening a fifo must neither block nor be served
+    fifo = os.path.join(tmpdir, "fifo")
+    os.mkfifo(fifo)
+    res = FileResponse(path=fifo)
+    res.zero_copy = True
+    with pytest.raises(RuntimeError) as exc:
+        loop.run_until_complete(res(receive, send))
+    assert "is not a file" in str(exc)
+
+
 def test_file_response_with_missing_file_raises_error(tmpdir):
     path = os.path.join(tmpdir, "404.txt")
 
@@ -4,7 +4,16 @@ import yast.status as http_status
 
 from yast import TestClient
 from yast.responses import JSONResponse, PlainTextResponse, Response
-from yast.routing import Host, Mount, NoMatchFound, Route, Router, WebSocketRoute
+from yast.routing import (
+    MATCH_CACHE_SIZE,
+    Host,
+    Match,
+    Mount,
+    NoMatchFound,
+    Route,
+    Router,
+    WebSocketRoute,
+)
 from yast.staticfiles import StaticFiles
 from yast.websockets import WebSocket, WebSocketDisconnect
 
@@ -359,3 +368,170 @@ def test_mount_at_root():
     mounted = Router([Mount("/", ok, name="users")])
     client = TestClient(mounted)
     assert client.get("/").status_code == 200
+
+
+def test_routes_changed_after_dispatch():
+    router = Router([Route("/", endpoint=ok)])
+    client = TestClient(router)
+    assert client.get("/").status_code == 200
+    assert client.get("/new").status_code == 404
+
+    router.routes.append(Route("/new", endpoint=ok))
+    assert client.get("/new").status_code == 200
+
+    router.routes = [Route("/other", endpoint=ok)]
+    assert client.get("/new").status_code == 404
+    assert client.get("/other").status_code == 200
+
+
+def test_route_match_cache():
+    route = Route("/cached", endpoint=ok)
+    scope = {"type": "http", "method": "GET", "path": "/cached"}
+    assert route.matches(scope)[0] == Match.FULL
+    assert route.matches(dict(scope, path="/other"))[0] == Match.NONE
+    assert route.matches(scope)[0] == Match.FULL
+
+    # more misses than the cache holds, results stay the same
+    for idx in range(MATCH_CACHE_SIZE * 2):
+        miss = dict(scope, path=f"/miss/{idx}")
+        assert route.matches(miss)[0] == Match.NONE
+    assert route.matches(scope)[0] == Match.FULL
+    assert route.matches(dict(scope, path="/other"))[0] == Match.NONE
+    assert route.matches(dict(scope, method="POST"))[0] == Match.PARTIAL
+
+    route = Route("/{name}", endpoint=ok)
+    for name in ("a", "b", "a"):
+        match, child_scope = route.matches(dict(scope, path=f"/{name}"))
+        assert match == Match.FULL
+        assert child_scope["path_params"] == {"name": name}
+
+
+def test_route_table_keeps_declared_order():
+    def name(request):
+        return PlainTextResponse(request.path_params["name"])
+
+    router = Router(
+        [
+            Route("/users", endpoint=ok, methods=["POST"]),
+            Route("/{name}", endpoint=name),
+            Route("/users", endpoint=ok),
+            Mount("/static", app=ok),
+            Route("/a.txt", endpoint=ok),
+        ]
+    )
+    client = TestClient(router)
+    assert client.get("/users").text == "users"
+    assert client.post("/users").text == "OK"
+    assert client.get("/static/css").text == "OK"
+    assert client.get("/a.txt").text == "a.txt"
+    assert client.get("/a/b").status_code == 404
+
+
+def test_route_table_joined_patterns():
+    def value(request):
+        return JSONResponse(request.path_params)
+
+    router = Router(
+        [
+            Route("/items/{id:int}", endpoint=value),
+            Route("/items/{price:float}/price", endpoint=value, methods=["POST"]),
+            Route("/items/{name}", endpoint=value),
+            Route("/items/{name}/price", endpoint=value),
+            Mount("/items/static", app=ok),
+        ]
+    )
+    client = TestClient(router)
+    assert client.get("/items/12").json() == {"id": 12}
+    assert client.get("/items/abc").json() == {"name": "abc"}
+    assert client.post("/items/1.5/price").json() == {"price": 1.5}
+    assert client.get("/items/1.5/price").json() == {"name": "1.5"}
+    assert client.get("/items/static/css").text == "OK"
+    assert client.get("/items/static").json() == {"name": "static"}
+    assert client.get("/items/a/b/c").status_code == 404
+
+    router = Router([Route("/items/{id:int}", endpoint=value), Mount("/items", app=ok)])
+    client = TestClient(router)
+    assert client.get("/items").url == "http://testserver/items/"
+
+
+def test_nested_path_params():
+    def value(request):
+        return JSONResponse(request.path_params)
+
+    router = Router(
+        [
+            Host(
+                "{subdomain}.example.org",
+                app=Router([Route("/{name}", endpoint=value)]),
+            )
+        ]
+    )
+    client = TestClient(router, base_url="https://foo.example.org/")
+    assert client.get("/bar").json() == {"subdomain": "foo", "name": "bar"}
+
+
+def test_url_path_for_literal_braces():
+    router = Router([Route("/{raw-x}/{id:int}", endpoint=ok, name="raw")])
+    assert router.url_path_for("raw", id=1) == "/{raw-x}/1"
+
+
+def test_router_url_path_for_nested_changes():
+    api = Router([Route("/u", endpoint=ok, name="user")])
+    router = Router([Mount("/api", app=api)])
+    assert router.url_path_for("user") == "/api/u"
+
+    api.routes[0] = Route("/v", endpoint=ok, name="user")
+    url = router.url_path_for("user")
+    assert url == "/api/v"
+    assert router.url_path_for("user") is not url
+
+
+def test_mount_literal_prefix():
+    mount = Mount("/static", app=ok)
+    scope = {"type": "http", "path": "/static/css/app.css", "root_path": "/api"}
+    match, child_scope = mount.matches(scope)
+    assert match is Match.FULL
+    assert child_scope["root_path"] == "/api/static"
+    assert child_scope["path"] == "/css/app.css"
+
+    for path in ("/static", "/staticfiles/app.css", "/static/a\nb"):
+        assert mount.matches(dict(scope, path=path))[0] is Match.NONE
+
+    match, child_scope = Mount("", app=ok).matches(scope)
+    assert match is Match.FULL
+    assert child_scope["path"] == "/static/css/app.css"
+
+    mount = Mount("/v1.0", app=ok)
+    assert mount.matches(dict(scope, path="/v1x0/items"))[0] is Match.FULL
+
+
+def test_router_unsupported_scope_type():
+    router = Router([Route("/", endpoint=ok)])
+    with pytest.raises(RuntimeError):
+        router({"type": "unknown", "path": "/"})
+
+
+def test_router_routes_replaced_in_place():
+    def endpoint_a(req):
+        return PlainTextResponse("a")
+
+    def endpoint_b(req):
+        return PlainTextResponse("b")
+
+    router = Router([Route("/x", endpoint=endpoint_a), Route("/z", endpoint=ok)])
+    client = TestClient(router)
+    assert client.get("/x").text == "a"
+
+    router.routes[0] = Route("/y", endpoint=endpoint_b)
+    assert client.get("/x").status_code == 404
+    assert client.get("/y").text == "b"
+
+    router.routes.reverse()
+    assert client.get("/y").text == "b"
+    assert client.get("/z").status_code == 200
+
+    del router.routes[router.routes.index(Route("/y", endpoint=endpoint_b))]
+    assert client.get("/y").status_code == 404
+
+    router.routes += [Route("/y", endpoint=endpoint_a)]
+    assert client.get("/y").text == "a"
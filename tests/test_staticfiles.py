@@ -1,3 +1,4 @@
+import asyncio
 import os
 import typing
 from email.utils import parsedate
@@ -5,6 +6,7 @@ from email.utils import parsedate
 import pytest
 
 from yast import TestClient
+from yast.responses import PlainTextResponse
 from yast.staticfiles import StaticFiles
 
 
@@ -101,6 +103,8 @@ def test_304_with_etag_match(tmpdir):
     res_2nd = client.get("/ex1.txt", headers={"if-none-match": res_1st.headers["etag"]})
     assert res_2nd.status_code == 304
     assert res_2nd.content == b""
+    assert res_2nd.headers["etag"] == res_1st.headers["etag"]
+    assert "content-type" not in res_2nd.headers
 
 
 def test_304_with_last_modified(tmpdir):
@@ -140,3 +144,117 @@ def test_staticfiles_with_package():
     response = client.get("/example.txt")
     assert response.status_code == 200
     assert response.text == "123\n"
+
+
+def test_staticfiles_stat_cache(tmpdir):
+    path = os.path.join(tmpdir, "example.txt")
+    with open(path, "w") as file:
+        file.write("<file content>")
+
+    app = StaticFiles(directory=tmpdir, stat_cache_ttl=60)
+    client = TestClient(app)
+    etag = client.get("/example.txt").headers["etag"]
+    assert "example.txt" in app._stat_cache
+
+    os.utime(path, (0, 0))
+    assert client.get("/example.txt").headers["etag"] == etag
+    assert client.get("/404.txt").status_code == 404
+    assert "404.txt" not in app._stat_cache
+
+    app.stat_cache_ttl = 0
+    assert client.get("/example.txt").headers["etag"] != etag
+
+
+def test_staticfiles_backslash_traversal(tmpdir, monkeypatch):
+    import ntpath
+
+    app = StaticFiles(directory=tmpdir)
+    scope = {"type": "http", "method": "GET", "path": "/a\\..\\..\\secret.txt"}
+    monkeypatch.setattr(os, "path", ntpath)
+    res = app(scope)
+    monkeypatch.undo()
+    assert isinstance(res, PlainTextResponse)
+    assert res.status_code == 404
+
+
+def test_staticfiles_rewritten_file(tmpdir):
+    path = os.path.join(tmpdir, "example.txt")
+    with open(path, "w") as file:
+        file.write("<file content>")
+
+    app = StaticFiles(directory=tmpdir)
+    client = TestClient(app)
+    assert client.get("/example.txt").text == "<file content>"
+
+    with open(path, "w") as file:
+        file.write("<a longer rewritten file content>")
+    res = client.get("/example.txt")
+    assert res.status_code == 200
+    assert res.text == "<a longer rewritten file content>"
+    assert res.headers["content-length"] == "33"
+    assert app._stat_cache == {}
+
+
+def test_staticfiles_deleted_file(tmpdir):
+    path = os.path.join(tmpdir, "example.txt")
+    with open(path, "w") as file:
+        file.write("<file content>")
+
+    app = StaticFiles(directory=tmpdir)
+    client = TestClient(app)
+    assert client.get("/example.txt").status_code == 200
+
+    os.remove(path)
+    res = client.get("/example.txt")
+    assert res.status_code == 404
+    assert res.text == "Not Found"
+
+
+def test_staticfiles_threaded_stat(tmpdir):
+    path = os.path.join(tmpdir, "example.txt")
+    with open(path, "w") as file:
+        file.write("<file content>")
+
+    app = StaticFiles(directory=tmpdir, sync_stat=False)
+    client = TestClient(app)
+    res = client.get("/example.txt")
+    assert res.status_code == 200
+    assert res.text == "<file content>"
+    assert client.get("/404.txt").status_code == 404
+
+
+def test_staticfiles_zero_copy_send(tmpdir):
+    path = os.path.join(tmpdir, "example.txt")
+    with open(path, "w") as file:
+        file.write("<file content>")
+
+    messages = []
+
+    async def receive():
+        return {"type": "http.disconnect"}  # pragma: nocover
+
+    async def send(message):
+        if message["type"] == "http.response.zerocopysend":
+            message = dict(message, file=message["file"].read())
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/example.txt",
+        "headers": [],
+        "extensions": {"http.response.zerocopysend": {}},
+    }
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(StaticFiles(directory=tmpdir)(scope)(receive, send))
+    assert messages[0]["status"] == 200
+    assert messages[1] == {
+        "type": "http.response.zerocopysend",
+        "file": b"<file content>",
+    }
+
+    messages.clear()
+    app = StaticFiles(directory=tmpdir, use_sendfile=False)
+    loop.run_until_complete(app(scope)(receive, send))
+    assert messages[1]["type"] == "http.response.body"
+    assert messages[1]["body"] == b"<file content>"
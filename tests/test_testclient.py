@@ -0,0 +1,22 @@
+from yast.requests import Request
+from yast.responses import PlainTextResponse
+from yast.testclient import RawResponse, TestClient
+
+
+def test_raw_request():
+    def app(scope):
+        async def asgi(receive, send):
+            req = Request(scope, receive)
+            body = await req.body()
+            text = f"{req.method} {req.url} {req.headers['x-token']} {body.decode()}"
+            res = PlainTextResponse(text)
+            await res(receive, send)
+
+        return asgi
+
+    client = TestClient(app)
+    res = client.raw_request("post", "/a?b=1", b"data", [(b"x-token", b"abc")])
+    assert res.status_code == 200
+    assert res.content == b"POST http://testserver/a?b=1 abc data"
+    assert (b"content-length", b"37") in res.headers
+    assert isinstance(res, RawResponse)
@@ -115,6 +115,37 @@ def test_websocket_send_and_receive_bytes():
         assert data == b"Message was: Hello, bytes!"
 
 
+def test_websocket_send_batch():
+    def app(scope):
+        async def asgi(receive, send):
+            session = WebSocket(scope, receive, send)
+            await session.accept()
+            await session.send_batch(["one", b"two", "three"])
+            await session.close()
+
+        return asgi
+
+    client = TestClient(app)
+    with client.wsconnect("/") as session:
+        assert session.receive_text() == "one"
+        assert session.receive_bytes() == b"two"
+        assert session.receive_text() == "three"
+
+
+def test_websocket_send_batch_before_accept():
+    def app(scope):
+        async def asgi(receive, send):
+            session = WebSocket(scope, receive, send)
+            await session.send_batch(["nope"])
+
+        return asgi
+
+    client = TestClient(app)
+    with pytest.raises(RuntimeError):
+        with client.wsconnect("/"):
+            pass  # pragma: nocover
+
+
 def test_websocket_send_and_receive_json():
     def app(scope):
         async def asgi(receive, send):
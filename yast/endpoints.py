@@ -11,8 +11,23 @@ from yast.responses import PlainTextResponse, Response
 from yast.types import Message, Receive, Scope, Send
 from yast.websockets import WebSocket
 
+HTTP_METHODS = ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+
 
 class HttpEndPoint(object):
+    # request method -> handler name, built once per subclass
+    _handlers: typing.Dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        handlers = {}
+        for method in HTTP_METHODS:
+            handler_name = "get" if method == "HEAD" else method.lower()
+            if hasattr(cls, handler_name):
+                handlers[method] = handler_name
+        # endfor
+        cls._handlers = handlers
+
     def __init__(self, scope: Scope) -> None:
         assert scope["type"] == "http"
         self.scope = scope
@@ -24,9 +39,14 @@ class HttpEndPoint(object):
         await res(receive, send)
 
     async def dispatch(self, req: Request) -> Response:
-        handler_name = "get" if req.method == "HEAD" else req.method.lower()
+        method = req.method
+        handler_name = self._handlers.get(method)
+        if handler_name is None:
+            # any other method is looked up as is and never remembered
+            handler_name = "get" if method == "HEAD" else method.lower()
         handler = getattr(self, handler_name, self.method_not_allowed)
 
+        # checked on the bound handler, it may have been replaced since
         if asyncio.iscoroutinefunction(handler):
             res = await handler(req)
         else:
@@ -1,7 +1,7 @@
 import asyncio
 import typing
 
-from yast.routing import BaseRoute, Match
+from yast.routing import NO_MATCH, BaseRoute, Match
 from yast.types import ASGIInstance, Receive, Scope, Send
 
 from .types import EventType
@@ -9,7 +9,7 @@ from .types import EventType
 
 class Lifespan(BaseRoute):
     def __init__(self, **handlers: typing.List[typing.Callable]) -> None:
-        self.handlers = {et: handlers.get(str(et), []) for et in list(EventType)}
+        self.handlers = {et: handlers.get(str(et), []) for et in EventType}
 
     def __call__(self, scope: Scope) -> ASGIInstance:
         return self.asgi
@@ -25,7 +25,7 @@ class Lifespan(BaseRoute):
             call_all_event_shutdown_handlers()
             await send({'type': 'lifespan.shutdown.complete'})
         """
-        for _ in list(EventType):
+        for _ in EventType:
             message = await receive()
             event_type = EventType.get_by_lifespan(message["type"])
             await self.handler(event_type)
@@ -34,7 +34,7 @@ class Lifespan(BaseRoute):
     def matches(self, scope: Scope) -> typing.Tuple[Match, Scope]:
         if scope["type"] == "lifespan":
             return Match.FULL, {}
-        return Match.NONE, {}
+        return NO_MATCH
 
     def add_event_handler(self, event_type: str, func: typing.Callable) -> None:
         self.handlers[EventType(event_type)].append(func)
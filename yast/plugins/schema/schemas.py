@@ -6,10 +6,19 @@ try:
 except ImportError:  # pragma: no cover
     yaml = None  # pragma: no cover
 
+try:
+    from yaml import CDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover
+    # pyyaml built without libyaml, or not installed at all
+    YamlDumper = getattr(yaml, "Dumper", None)  # pragma: no cover
+    YamlLoader = getattr(yaml, "SafeLoader", None)  # pragma: no cover
+
 from yast.requests import Request
 from yast.responses import Response
 from yast.routing import BaseRoute, Mount, Route
 
+ENDPOINT_METHODS = ("get", "post", "put", "patch", "delete", "options")
+
 
 class EndPointInfo(typing.NamedTuple):
     path: str
@@ -47,15 +56,12 @@ class BaseSchemaGenerator(object):
                         )
                     )
             else:
-                methods = ["get", "post", "put", "patch", "delete", "options"]
-                for method in methods:
-                    if not hasattr(route.endpoint, method):
+                for method in ENDPOINT_METHODS:
+                    func = getattr(route.endpoint, method, None)
+                    if func is None:
                         continue
-                    func = getattr(route.endpoint, method)
                     endpoints_info.append(
-                        EndPointInfo(
-                            "".join((parent_path, route.path)), method.lower(), func
-                        )
+                        EndPointInfo("".join((parent_path, route.path)), method, func)
                     )
             # endif
         # endfor
@@ -67,7 +73,7 @@ class BaseSchemaGenerator(object):
             return {}
 
         docstring = docstring.split("----")[-1]
-        parsed = yaml.safe_load(docstring)
+        parsed = yaml.load(docstring, Loader=YamlLoader)
 
         if not isinstance(parsed, dict):
             return {}
@@ -112,4 +118,5 @@ class OpenAPIResponse(Response):
             content, dict
         ), "The schema passed to OpenAPIResponse should be a dict"
 
-        return yaml.dump(content, default_flow_style=False).encode("utf-8")
+        dumped = yaml.dump(content, Dumper=YamlDumper, default_flow_style=False)
+        return dumped.encode("utf-8")
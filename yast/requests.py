@@ -4,6 +4,7 @@ import json
 import typing
 import warnings
 from collections.abc import Mapping
+from functools import cached_property
 from typing import Iterator
 from urllib.parse import unquote
 
@@ -38,44 +39,36 @@ class HttpConnection(Mapping):
     def __len__(self) -> int:
         return len(self._scope)
 
-    @property
+    @cached_property
     def url(self) -> URL:
-        if not hasattr(self, "_url"):
-            self._url = URL(scope=self._scope)
-        return self._url
+        return URL(scope=self._scope)
 
     @property
     def app(self) -> typing.Any:
         return self._scope["app"]
 
-    @property
+    @cached_property
     def headers(self) -> Headers:
-        if not hasattr(self, "_headers"):
-            self._headers = Headers(scope=self._scope)
-        return self._headers
+        return Headers(scope=self._scope)
 
-    @property
+    @cached_property
     def query_params(self) -> QueryParams:
-        if not hasattr(self, "_query_params"):
-            self._query_params = QueryParams(self._scope["query_string"])
-        return self._query_params
+        return QueryParams(self._scope["query_string"])
 
     @property
     def path_params(self) -> dict:
         return self._scope.get("path_params", {})
 
-    @property
+    @cached_property
     def cookie(self) -> typing.Dict[str, str]:
-        if not hasattr(self, "_cookies"):
-            cookies = {}
-            cookie_headers = self.headers.get("cookie")
-            if cookie_headers:
-                cookie = http.cookies.SimpleCookie()
-                cookie.load(cookie_headers)
-                for k, morse in cookie.items():
-                    cookies[k] = morse.value
-            self._cookies = cookies
-        return self._cookies
+        cookies = {}
+        cookie_headers = self.headers.get("cookie")
+        if cookie_headers:
+            cookie = http.cookies.SimpleCookie()
+            cookie.load(cookie_headers)
+            for k, morse in cookie.items():
+                cookies[k] = morse.value
+        return cookies
 
     @property
     def client(self) -> Address:
@@ -142,18 +135,15 @@ class Request(HttpConnection):
     def method(self) -> str:
         return self._scope["method"]
 
-    @property
+    @cached_property
     def relative_url(self) -> URL:
-        if not hasattr(self, "_relative_url"):
-            url = self._scope["path"]
-            query_str = self._scope["query_string"]
-
-            if query_str:
-                url += "?" + unquote(query_str.decode())
+        url = self._scope["path"]
+        query_str = self._scope["query_string"]
 
-            self._relative_url = url
+        if query_str:
+            url += "?" + unquote(query_str.decode())
 
-        return self._relative_url
+        return url
 
     @property
     def receive(self):
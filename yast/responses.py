@@ -1,3 +1,4 @@
+import functools
 import hashlib
 import http.cookies
 import json
@@ -9,6 +10,7 @@ from mimetypes import guess_type
 from urllib.parse import quote_plus
 
 from yast.background import BackgroundTask
+from yast.concurrency import run_in_threadpool
 from yast.datastructures import URL, MutableHeaders
 from yast.types import Receive, Send
 
@@ -199,10 +201,50 @@ class StreamingResponse(Response):
             await self.background()
 
 
+# asgi extension, the server sends the file itself, e.g. with sendfile(2)
+ZERO_COPY_SEND = "http.response.zerocopysend"
+
+
+@functools.lru_cache(maxsize=4096)
+def build_stat_headers(
+    st_mtime: float, st_size: int
+) -> typing.Tuple[typing.Tuple[str, str], ...]:
+    """
+    the headers depend on nothing but mtime and size,
+    so a file served again keeps getting the same ones
+    """
+    etag_base = str(st_mtime) + "-" + str(st_size)
+    return (
+        ("content-length", str(st_size)),
+        ("last-modified", formatdate(st_mtime, usegmt=True)),
+        ("etag", hashlib.md5(etag_base.encode()).hexdigest()),
+    )
+
+
+def open_regular_file(path: str) -> typing.Tuple[typing.BinaryIO, os.stat_result]:
+    """
+    open for reading and fstat, without ever blocking on a fifo or the like,
+    raises RuntimeError unless it is a regular file
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_NONBLOCK", 0))
+    except FileNotFoundError:
+        raise RuntimeError(f"File at path {path} does not exists.")
+    except IsADirectoryError:
+        raise RuntimeError(f"File at path {path} is not a file.")
+
+    stat_result = os.fstat(fd)
+    if not stat.S_ISREG(stat_result.st_mode):
+        os.close(fd)
+        raise RuntimeError(f"File at path {path} is not a file.")
+    return os.fdopen(fd, "rb"), stat_result
+
+
 class FileResponse(Response):
     """File Response"""
 
     chunk_size = 4096
+    zero_copy = False
 
     def __init__(
         self,
@@ -234,25 +276,23 @@ class FileResponse(Response):
             self.set_stat_headers(stat_result)
 
     def set_stat_headers(self, stat_result: os.stat_result):
-        stat_headers = self.get_stat_headers(stat_result)
-        for _name, _value in stat_headers.items():
+        stat_headers = build_stat_headers(stat_result.st_mtime, stat_result.st_size)
+        for _name, _value in stat_headers:
             if self.send_header_only and _name == "content-length":
                 continue
             self.headers.setdefault(_name, _value)
 
     @classmethod
     def get_stat_headers(cls, stat_result: os.stat_result) -> typing.Dict[str, str]:
-        content_length = str(stat_result.st_size)
-        last_modified = formatdate(stat_result.st_mtime, usegmt=True)
-        etag_base = str(stat_result.st_mtime) + "-" + str(stat_result.st_size)
-        etag = hashlib.md5(etag_base.encode()).hexdigest()
-        return {
-            "content-length": content_length,
-            "last-modified": last_modified,
-            "etag": etag,
-        }
+        return dict(build_stat_headers(stat_result.st_mtime, stat_result.st_size))
 
     async def __call__(self, receive: Receive, send: Send) -> None:
+        if self.zero_copy and not self.send_header_only:
+            await self.send_zero_copy(send)
+            if self.background is not None:
+                await self.background()
+            return
+
         if self.stat_result is None:
             try:
                 stat_result = await aio_stat(self.path)
@@ -290,6 +330,33 @@ class FileResponse(Response):
         if self.background is not None:
             await self.background()
 
+    async def send_zero_copy(self, send: Send) -> None:
+        """
+        the file is opened first, off the loop, and its headers come from
+        fstat on that very file, it is what the server is going to send
+        """
+        file, stat_result = await run_in_threadpool(open_regular_file, self.path)
+        with file:
+            stale = {}
+            if self.stat_result is not None:
+                stale = self.get_stat_headers(self.stat_result)
+            for _name, _value in build_stat_headers(
+                stat_result.st_mtime, stat_result.st_size
+            ):
+                # replace what came from an older stat, keep headers given by hand
+                if self.headers.get(_name) in (None, stale.get(_name)):
+                    self.headers[_name] = _value
+            # endfor
+
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": self.status_code,
+                    "headers": self.raw_headers,
+                }
+            )
+            await send({"type": ZERO_COPY_SEND, "file": file})
+
 
 class RedirectResponse(Response):
     def __init__(
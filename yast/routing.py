@@ -1,12 +1,14 @@
 import enum
-import inspect
+import functools
 import re
+import sys
+import types
 import typing
 from asyncio import iscoroutinefunction
 
 from yast.concurrency import run_in_threadpool
 from yast.convertors import CONVERTOR_TYPES, Convertor
-from yast.datastructures import URL, Headers, URLPath
+from yast.datastructures import URL, URLPath
 from yast.exceptions import HttpException
 from yast.requests import Request
 from yast.responses import PlainTextResponse, RedirectResponse
@@ -24,13 +26,24 @@ class Match(enum.Enum):
     FULL = 2
 
 
+# shared result of every failed match, its scope must never be written to
+NO_MATCH = (Match.NONE, types.MappingProxyType({}))
+FUNCTION_TYPES = (types.FunctionType, types.MethodType)
 PARAM_REGEX = re.compile("{([a-zA-Z_][a-zA-Z0-9_]*)(:[a-zA-Z_][a-zA-Z0-9_]*)?}")
 
 
 def compile_path(
     path: str,
 ) -> typing.Tuple[typing.Pattern, str, typing.Dict[str, Convertor]]:
-    path_regex = "^"
+    path_regex, path_format, param_converts = _compile_path(path)
+    return path_regex, path_format, dict(param_converts)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_path(
+    path: str,
+) -> typing.Tuple[typing.Pattern, str, typing.Tuple[typing.Tuple[str, Convertor], ...]]:
+    path_regex = ""
     path_format = ""
 
     idx = 0
@@ -38,6 +51,7 @@ def compile_path(
 
     for match in PARAM_REGEX.finditer(path):
         param_name, convert_type = match.groups("str")
+        param_name = sys.intern(param_name)
         convert_type = convert_type.lstrip(":")
         assert (
             convert_type in CONVERTOR_TYPES
@@ -47,7 +61,7 @@ def compile_path(
         path_regex += path[idx : match.start()]
         path_regex += "(?P<%s>%s)" % (param_name, convertor.regex)
 
-        path_format += path[idx : match.start()]
+        path_format += escape_format(path[idx : match.start()])
         path_format += "{%s}" % param_name
 
         param_converts[param_name] = convertor
@@ -55,13 +69,43 @@ def compile_path(
         idx = match.end()
     # endfor
 
-    path_regex += path[idx:] + "$"
-    path_format += path[idx:]
+    path_regex += path[idx:]
+    path_format += escape_format(path[idx:])
+
+    return re.compile(path_regex), path_format, tuple(param_converts.items())
+
+
+def get_param_converts(
+    param_convertors: typing.Dict[str, Convertor],
+) -> typing.Tuple[typing.Tuple[str, typing.Callable[[str], typing.Any]], ...]:
+    return tuple(
+        (key, convertor.convert) for key, convertor in param_convertors.items()
+    )
+
 
-    return re.compile(path_regex), path_format, param_converts
+MATCH_CACHE_SIZE = 256
+_NOT_CACHED = object()
+
+
+def cached_match(
+    path_regex: typing.Pattern, path: str, cache: dict
+) -> typing.Optional[typing.Match]:
+    """
+    only used by routes without path params, their matching result depends
+    on nothing but the path, remember it for the last looked up paths
+    """
+    match = cache.get(path, _NOT_CACHED)
+    if match is _NOT_CACHED:
+        match = path_regex.fullmatch(path)
+        if len(cache) >= MATCH_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[path] = match
+    return match
 
 
 class BaseRoute(object):
+    __slots__ = ()
+
     def matches(self, scope: Scope) -> typing.Tuple[Match, Scope]:
         raise NotImplementedError()  # pragma: nocover
 
@@ -72,14 +116,28 @@ class BaseRoute(object):
         raise NotImplementedError()  # pragma: nocover
 
     def __str__(self) -> str:
-        return "%s(path=%s,endpoint=%s)" % (
-            self.__class__.__name__,
-            getattr(self, "path", ""),
-            getattr(self, "name", ""),
-        )
+        # Host and Lifespan have no `path`, user routes may have no `name`
+        path = getattr(self, "path", "")
+        name = getattr(self, "name", "")
+        return f"{self.__class__.__name__}(path={path},endpoint={name})"
 
 
 class Route(BaseRoute):
+    __slots__ = (
+        "path",
+        "endpoint",
+        "name",
+        "include_in_schema",
+        "app",
+        "methods",
+        "path_regex",
+        "path_format",
+        "param_convertors",
+        "param_names",
+        "_param_converts",
+        "_match_cache",
+    )
+
     def __init__(
         self,
         path: str,
@@ -94,7 +152,7 @@ class Route(BaseRoute):
         self.endpoint = endpoint
         self.name = get_name(endpoint) if name is None else name
         self.include_in_schema = include_in_schema
-        if inspect.isfunction(endpoint) or inspect.ismethod(endpoint):
+        if isinstance(endpoint, FUNCTION_TYPES):
             self.app = req_res(endpoint)
             if methods is None:
                 methods = ["GET"]
@@ -104,40 +162,49 @@ class Route(BaseRoute):
         if methods is None:
             self.methods = None
         else:
-            self.methods = set([method.upper() for method in methods])
-            if "GET" in self.methods:
-                self.methods |= set(["HEAD"])
+            methods = {method.upper() for method in methods}
+            if "GET" in methods:
+                methods.add("HEAD")
+            self.methods = frozenset(methods)
 
         (self.path_regex, self.path_format, self.param_convertors) = compile_path(path)
+        self.param_names = frozenset(self.param_convertors)
+        self._param_converts = get_param_converts(self.param_convertors)
+        self._match_cache = None if self.param_convertors else {}
 
     def matches(self, scope: Scope) -> typing.Tuple[Match, Scope]:
         if scope["type"] == "http":
-            match = self.path_regex.match(scope["path"])
+            match_cache = self._match_cache
+            if match_cache is None:
+                match = self.path_regex.fullmatch(scope["path"])
+            else:
+                match = cached_match(self.path_regex, scope["path"], match_cache)
 
             if match:
                 matched_params = match.groupdict()
-                for _k, _v in matched_params.items():
-                    matched_params[_k] = self.param_convertors[_k].convert(_v)
-                path_params = dict(scope.get("path_params", {}))
-                path_params.update(matched_params)
+                for key, convert in self._param_converts:
+                    matched_params[key] = convert(matched_params[key])
+                parent_params = scope.get("path_params")
+                if parent_params:
+                    path_params = {**parent_params, **matched_params}
+                else:
+                    path_params = matched_params
                 child_scope = {"endpoint": self.endpoint, "path_params": path_params}
-                if self.methods and scope["method"] not in self.methods:
+                methods = self.methods
+                if methods and scope["method"] not in methods:
                     return Match.PARTIAL, child_scope
                 return Match.FULL, child_scope
-        return Match.NONE, {}
+        return NO_MATCH
 
     def url_path_for(self, name: str, **path_params: str) -> URLPath:
-        seen_params = set(path_params.keys())
-        excepted_params = set(self.param_convertors.keys())
-        if name != self.name or seen_params != excepted_params:
+        if name != self.name or path_params.keys() != self.param_names:
             raise NoMatchFound()
-        path, remaining_params = replace_params(
-            self.path_format, self.param_convertors, path_params
-        )
+        path, _ = replace_params(self.path_format, self.param_convertors, path_params)
         return URLPath(protocol="http", path=path)
 
     def __call__(self, scope: Scope) -> ASGIInstance:
-        if self.methods and scope["method"] not in self.methods:
+        methods = self.methods
+        if methods and scope["method"] not in methods:
             if "app" in scope:
                 raise HttpException(status_code=405)
             return PlainTextResponse("Method Not Allowed", 405)
@@ -154,6 +221,19 @@ class Route(BaseRoute):
 
 
 class WebSocketRoute(BaseRoute):
+    __slots__ = (
+        "path",
+        "endpoint",
+        "name",
+        "app",
+        "path_regex",
+        "path_format",
+        "param_convertors",
+        "param_names",
+        "_param_converts",
+        "_match_cache",
+    )
+
     def __init__(
         self, path: str, endpoint: typing.Callable, *, name: str = None
     ) -> None:
@@ -162,38 +242,40 @@ class WebSocketRoute(BaseRoute):
         self.endpoint = endpoint
         self.name = get_name(endpoint) if name is None else name
 
-        if inspect.isfunction(endpoint) or inspect.ismethod(endpoint):
+        if isinstance(endpoint, FUNCTION_TYPES):
             self.app = ws_session(endpoint)
         else:
             self.app = endpoint
 
-        regex = "^" + path + "$"
-        regex = re.sub("{([a-zA-Z_][a-zA-Z0-9_]*)}", r"(?P<\1>[^/]+)", regex)
-
         (self.path_regex, self.path_format, self.param_convertors) = compile_path(path)
+        self.param_names = frozenset(self.param_convertors)
+        self._param_converts = get_param_converts(self.param_convertors)
+        self._match_cache = None if self.param_convertors else {}
 
     def matches(self, scope: Scope) -> typing.Tuple[Match, Scope]:
         if scope["type"] == "websocket":
-            match = self.path_regex.match(scope["path"])
+            match_cache = self._match_cache
+            if match_cache is None:
+                match = self.path_regex.fullmatch(scope["path"])
+            else:
+                match = cached_match(self.path_regex, scope["path"], match_cache)
             if match:
                 matched_params = match.groupdict()
-                for _k, _v in matched_params.items():
-                    matched_params[_k] = self.param_convertors[_k].convert(_v)
-                path_params = dict(scope.get("path_params", {}))
-                path_params.update(matched_params)
+                for key, convert in self._param_converts:
+                    matched_params[key] = convert(matched_params[key])
+                parent_params = scope.get("path_params")
+                if parent_params:
+                    path_params = {**parent_params, **matched_params}
+                else:
+                    path_params = matched_params
                 child_scope = {"endpoint": self.endpoint, "path_params": path_params}
                 return Match.FULL, child_scope
-        return Match.NONE, {}
+        return NO_MATCH
 
     def url_path_for(self, name: str, **path_params: str) -> URLPath:
-        seen_params = set(path_params.keys())
-        expected_params = set(self.param_convertors.keys())
-        if name != self.name or seen_params != expected_params:
+        if name != self.name or path_params.keys() != self.param_names:
             raise NoMatchFound()
-        path, remaining_params = replace_params(
-            self.path_format, self.param_convertors, path_params
-        )
-        assert not remaining_params
+        path, _ = replace_params(self.path_format, self.param_convertors, path_params)
         return URLPath(protocol="websocket", path=path)
 
     def __call__(self, scope: Scope) -> ASGIInstance:
@@ -208,6 +290,17 @@ class WebSocketRoute(BaseRoute):
 
 
 class Mount(BaseRoute):
+    __slots__ = (
+        "path",
+        "app",
+        "name",
+        "path_regex",
+        "path_format",
+        "param_convertors",
+        "_param_converts",
+        "_prefix",
+    )
+
     def __init__(
         self,
         path: str,
@@ -229,6 +322,12 @@ class Mount(BaseRoute):
         (self.path_regex, self.path_format, self.param_convertors) = compile_path(
             self.path + "/{path:path}"
         )
+        self._param_converts = get_param_converts(self.param_convertors)
+        # a plain literal prefix needs no regex to be matched
+        if NON_LITERAL_REGEX.search(self.path):
+            self._prefix = None
+        else:
+            self._prefix = self.path + "/"
 
     @property
     def routes(self):
@@ -237,15 +336,32 @@ class Mount(BaseRoute):
     def matches(self, scope: Scope) -> typing.Tuple[Match, Scope]:
         if scope["type"] in ("http", "websocket"):
             path = scope["path"]
-            match = self.path_regex.match(path)
+            prefix = self._prefix
+            if prefix is not None:
+                # same result as the regex, whose `.*` stops at newlines
+                if not path.startswith(prefix) or "\n" in path:
+                    return NO_MATCH
+                parent_params = scope.get("path_params")
+                matched_path = self.path
+                return Match.FULL, {
+                    "path_param": dict(parent_params) if parent_params else {},
+                    "root_path": scope.get("root_path", "") + matched_path,
+                    "path": path[len(matched_path) :],
+                    "endpoint": self.app,
+                }
+
+            match = self.path_regex.fullmatch(path)
             if match:
                 matched_params = match.groupdict()
-                for _k, _v in matched_params.items():
-                    matched_params[_k] = self.param_convertors[_k].convert(_v)
+                for key, convert in self._param_converts:
+                    matched_params[key] = convert(matched_params[key])
                 remaining_path = "/" + matched_params.pop("path")
                 matched_path = path[: -len(remaining_path)]
-                path_params = dict(scope.get("path_params", {}))
-                path_params.update(matched_params)
+                parent_params = scope.get("path_params")
+                if parent_params:
+                    path_params = {**parent_params, **matched_params}
+                else:
+                    path_params = matched_params
                 child_scope = {
                     "path_param": path_params,
                     "root_path": scope.get("root_path", "") + matched_path,
@@ -253,7 +369,7 @@ class Mount(BaseRoute):
                     "endpoint": self.app,
                 }
                 return Match.FULL, child_scope
-        return Match.NONE, {}
+        return NO_MATCH
 
     def url_path_for(self, name: str, **path_params: str) -> URLPath:
         if self.name is not None and name == self.name and "path" in path_params:
@@ -298,11 +414,22 @@ class Mount(BaseRoute):
 
 
 class Host(BaseRoute):
+    __slots__ = (
+        "host",
+        "app",
+        "name",
+        "host_regex",
+        "host_format",
+        "param_convertors",
+        "_param_converts",
+    )
+
     def __init__(self, host: str, app: ASGIApp, name: str = None) -> None:
         self.host = host
         self.app = app
         self.name = name
         (self.host_regex, self.host_format, self.param_convertors) = compile_path(host)
+        self._param_converts = get_param_converts(self.param_convertors)
 
     @property
     def routes(self) -> typing.List[BaseRoute]:
@@ -310,20 +437,26 @@ class Host(BaseRoute):
 
     def matches(self, scope: Scope) -> typing.Tuple[Match, Scope]:
         if scope["type"] in ("http", "websocket"):
-            headers = Headers(scope=scope)
-            host = headers.get("host", "").split(":")[0]
-            matched = self.host_regex.match(host)
+            host = ""
+            for key, value in scope["headers"]:
+                if key == b"host":
+                    host = value.decode("latin-1").partition(":")[0]
+                    break
+            matched = self.host_regex.fullmatch(host)
             if matched:
                 matched_params = matched.groupdict()
-                for key, value in matched_params.items():
-                    matched_params[key] = self.param_convertors[key].convert(value)
-                path_params = dict(scope.get("path_params", {}))
-                path_params.update(matched_params)
+                for key, convert in self._param_converts:
+                    matched_params[key] = convert(matched_params[key])
+                parent_params = scope.get("path_params")
+                if parent_params:
+                    path_params = {**parent_params, **matched_params}
+                else:
+                    path_params = matched_params
                 child_scope = {"path_params": path_params, "endpoint": self.app}
                 return Match.FULL, child_scope
             # endif
         # endif
-        return Match.NONE, {}
+        return NO_MATCH
 
     def url_path_for(self, name: str, **path_params: str) -> URLPath:
         if self.name is not None and name == self.name and "path" in path_params:
@@ -363,6 +496,159 @@ class Host(BaseRoute):
         )
 
 
+SCOPE_TYPES = ("http", "websocket", "lifespan")
+
+# scope types a builtin route can ever match, routes of any other class are
+# tried against every scope type
+ROUTE_SCOPE_TYPES = {
+    Route: ("http",),
+    WebSocketRoute: ("websocket",),
+    Mount: ("http", "websocket"),
+    Host: ("http", "websocket"),
+}
+
+
+# characters that keep a path segment from being matched literally
+NON_LITERAL_REGEX = re.compile(r"[{}\[\]().*+?^$|\\]")
+GROUP_NAME_REGEX = re.compile(r"\(\?P<[a-zA-Z_][a-zA-Z0-9_]*>")
+
+
+def first_segment(path: str) -> str:
+    end = path.find("/", 1)
+    return path[1:] if end == -1 else path[1:end]
+
+
+class RouteTable(object):
+    """
+    routes of one scope type, grouped by the literal first path segment
+    they require, so a lookup only tries the routes that can match the path;
+    every group keeps the declared order of the routes
+    """
+
+    __slots__ = ("routes", "segments", "others", "static")
+
+    def __init__(self, routes: typing.Sequence[BaseRoute]) -> None:
+        route_segments = [self.get_literal_segment(route) for route in routes]
+        segments = {segment: [] for segment in route_segments if segment is not None}
+        others = []
+        for route, segment in zip(routes, route_segments):
+            if segment is not None:
+                segments[segment].append(route)
+                continue
+            for candidates in segments.values():
+                candidates.append(route)
+            others.append(route)
+
+        self.routes = tuple(routes)
+        self.segments = {_k: self.get_group(_v) for _k, _v in segments.items()}
+        self.others = self.get_group(others)
+
+        # lookup results of the paths declared by routes without path params
+        self.static = {}
+        for route in routes:
+            if (
+                type(route) in (Route, WebSocketRoute)
+                and not route.param_convertors
+                and not NON_LITERAL_REGEX.search(route.path)
+            ):
+                self.static.setdefault(route.path, self.scan(route.path))
+
+    @staticmethod
+    def get_literal_segment(route: BaseRoute) -> typing.Optional[str]:
+        route_class = type(route)
+        if route_class is Route or route_class is WebSocketRoute:
+            path = route.path
+        elif route_class is Mount and route.path:
+            path = route.path
+        else:
+            return None
+
+        segment = first_segment(path)
+        if NON_LITERAL_REGEX.search(segment):
+            return None
+        return segment
+
+    @staticmethod
+    def get_group(
+        routes: typing.List[BaseRoute],
+    ) -> typing.Tuple[tuple, typing.Optional[typing.Pattern], dict]:
+        """
+        when every route of the group is matched by its path regex alone, all
+        of them are joined into one alternation, whose matched branch tells
+        the first route worth trying
+        """
+        if len(routes) < 2 or any(
+            type(route) not in (Route, WebSocketRoute, Mount) for route in routes
+        ):
+            return tuple(routes), None, {}
+
+        branches = []
+        for idx, route in enumerate(routes):
+            pattern = GROUP_NAME_REGEX.sub("(?:", route.path_regex.pattern)
+            branches.append("(?P<r%d>%s)" % (idx, pattern))
+        pattern = re.compile("|".join(branches))
+        starts = {pattern.groupindex["r%d" % idx]: idx for idx in range(len(routes))}
+        return tuple(routes), pattern, starts
+
+    def scan(self, path: str) -> typing.Tuple[BaseRoute, ...]:
+        routes = self.segments.get(first_segment(path), self.others)[0]
+        for idx, route in enumerate(routes):
+            if type(route) not in (Route, WebSocketRoute, Mount):
+                return routes[idx:]
+            if route.path_regex.fullmatch(path):
+                return routes[idx:]
+        return ()
+
+    def lookup(self, path: str) -> typing.Tuple[BaseRoute, ...]:
+        routes = self.static.get(path)
+        if routes is not None:
+            return routes
+
+        routes, pattern, starts = self.segments.get(first_segment(path), self.others)
+        if pattern is None:
+            return routes
+
+        match = pattern.fullmatch(path)
+        if match is None:
+            return ()
+        return routes[starts[match.lastindex] :]
+
+
+def _changes_routes(method: typing.Callable) -> typing.Callable:
+    @functools.wraps(method)
+    def wrapper(self: "RouteList", *args: typing.Any, **kwargs: typing.Any):
+        result = method(self, *args, **kwargs)
+        self.on_change()
+        return result
+
+    return wrapper
+
+
+class RouteList(list):
+    """a list of routes, every change is reported to its router"""
+
+    __slots__ = ("on_change",)
+
+    def __init__(
+        self, routes: typing.Iterable[BaseRoute], on_change: typing.Callable
+    ) -> None:
+        super().__init__(routes)
+        self.on_change = on_change
+
+    __setitem__ = _changes_routes(list.__setitem__)
+    __delitem__ = _changes_routes(list.__delitem__)
+    __iadd__ = _changes_routes(list.__iadd__)
+    __imul__ = _changes_routes(list.__imul__)
+    append = _changes_routes(list.append)
+    extend = _changes_routes(list.extend)
+    insert = _changes_routes(list.insert)
+    pop = _changes_routes(list.pop)
+    remove = _changes_routes(list.remove)
+    clear = _changes_routes(list.clear)
+    sort = _changes_routes(list.sort)
+    reverse = _changes_routes(list.reverse)
+
+
 class Router(object):
     def __init__(
         self,
@@ -370,11 +656,23 @@ class Router(object):
         redirect_slashes: bool = True,
         default: ASGIApp = None,
     ) -> None:
-        self.routes = [] if routes is None else list(routes)
+        self.routes = [] if routes is None else routes
         self.redirect_slashes = redirect_slashes
         self.default = self.not_found if default is None else default
         self._lifespan = None
 
+    @property
+    def routes(self) -> typing.List[BaseRoute]:
+        return self._routes
+
+    @routes.setter
+    def routes(self, routes: typing.Iterable[BaseRoute]) -> None:
+        self._routes = RouteList(routes, self._drop_dispatch_tables)
+        self._dispatch_tables = None
+
+    def _drop_dispatch_tables(self) -> None:
+        self._dispatch_tables = None
+
     def mount(self, path: str, app: ASGIApp, name: str = None) -> None:
         prefix = Mount(path, app=app, name=name)
         self.routes.append(prefix)
@@ -447,6 +745,18 @@ class Router(object):
 
         raise NoMatchFound()
 
+    def _get_dispatch_tables(self) -> typing.Dict[str, RouteTable]:
+        # dropped by RouteList on every change, rebuilt on the next dispatch
+        tables = self._dispatch_tables
+        if tables is None:
+            tables = {scope_type: [] for scope_type in SCOPE_TYPES}
+            for route in self.routes:
+                for scope_type in ROUTE_SCOPE_TYPES.get(type(route), SCOPE_TYPES):
+                    tables[scope_type].append(route)
+            tables = {_k: RouteTable(_v) for _k, _v in tables.items()}
+            self._dispatch_tables = tables
+        return tables
+
     @property
     def lifespan(self):
         return self._lifespan
@@ -456,19 +766,26 @@ class Router(object):
         self._lifespan = lifespan
 
     def __call__(self, scope: Scope) -> ASGIInstance:
-        assert scope["type"] in ("http", "websocket", "lifespan")
+        scope_type = scope["type"]
+        table = self._get_dispatch_tables().get(scope_type)
+        if table is None:
+            raise RuntimeError(f'Unsupported scope type "{scope_type}"')
 
         if "router" not in scope:
             scope["router"] = self
 
         partial = None
+        if scope_type == "lifespan":
+            routes = table.routes
+        else:
+            routes = table.lookup(scope["path"])
 
-        for route in self.routes:
+        for route in routes:
             match, child_scope = route.matches(scope)
-            if match == Match.FULL:
+            if match is Match.FULL:
                 scope.update(child_scope)
                 return route(scope)
-            elif match == Match.PARTIAL and partial is None:
+            elif match is Match.PARTIAL and partial is None:
                 partial = route
                 partial_scope = child_scope
 
@@ -476,18 +793,24 @@ class Router(object):
             scope.update(partial_scope)
             return partial(scope)
 
-        if scope["type"] == "http" and self.redirect_slashes:
-            if not scope["path"].endswith("/"):
-                redirect_scope = dict(scope)
-                redirect_scope["path"] += "/"
+        if scope_type == "http" and self.redirect_slashes:
+            path = scope["path"]
+            if not path.endswith("/"):
+                redirect_path = path + "/"
+                routes = table.lookup(redirect_path)
+            else:
+                routes = ()
+
+            if routes:
+                redirect_scope = dict(scope, path=redirect_path)
 
-                for route in self.routes:
+                for route in routes:
                     match, child_scope = route.matches(redirect_scope)
-                    if match != Match.NONE:
+                    if match is not Match.NONE:
                         redirect_url = URL(scope=redirect_scope)
                         return RedirectResponse(url=str(redirect_url))
 
-        if self._lifespan is not None and scope["type"] == "lifespan":
+        if self._lifespan is not None and scope_type == "lifespan":
             return self._lifespan(scope)
 
         return self.default(scope)
@@ -505,21 +828,25 @@ class ProtocalRouter(object):
 
 
 def req_res(func: typing.Callable):
-    is_coroutine = iscoroutinefunction(func)
+    if iscoroutinefunction(func):
 
-    def app(scope: Scope) -> ASGIInstance:
-        async def awaitable(recv: Receive, send: Send) -> None:
-            req = Request(scope, recv)
-            # kwargs = scope.get("kwargs", {})
-            if is_coroutine:
-                res = await func(req)
-            else:
-                res = await run_in_threadpool(func, req)
+        def app(scope: Scope) -> ASGIInstance:
+            async def awaitable(recv: Receive, send: Send) -> None:
+                res = await func(Request(scope, recv))
+                await res(recv, send)
 
-            await res(recv, send)
+            return awaitable
 
-        return awaitable
+    else:
+
+        def app(scope: Scope) -> ASGIInstance:
+            async def awaitable(recv: Receive, send: Send) -> None:
+                res = await run_in_threadpool(func, Request(scope, recv))
+                await res(recv, send)
 
+            return awaitable
+
+    # endif
     return app
 
 
@@ -535,23 +862,37 @@ def ws_session(func: typing.Callable):
 
 
 def get_name(endpoint: typing.Callable) -> str:
-    if inspect.isfunction(endpoint) or inspect.isclass(endpoint):
+    if isinstance(endpoint, (types.FunctionType, type)):
         return endpoint.__name__
 
     return endpoint.__class__.__name__
 
 
+class FormatParams(dict):
+    def __missing__(self, key: str) -> str:
+        return "{%s}" % key
+
+
+def escape_format(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
 def replace_params(
     path: str,
     param_converts: typing.Dict[str, Convertor],
     path_params: typing.Dict[str, str],
 ) -> typing.Tuple[str, dict]:
-    for _k, _v in list(path_params.items()):
-        if "{" + _k + "}" in path:
-            convert = param_converts[_k]
-            _v = convert.to_string(_v)
-            path = path.replace("{" + _k + "}", _v)
-            path_params.pop(_k)
-        # end if
+    """
+    `path` is a `path_format` built by `compile_path`, so its placeholders are
+    exactly the keys of `param_converts`; params without placeholder are
+    given back as the remaining params
+    """
+    converted = FormatParams()
+    remaining_params = {}
+    for _k, _v in path_params.items():
+        if _k in param_converts:
+            converted[_k] = param_converts[_k].to_string(_v)
+        else:
+            remaining_params[_k] = _v
     # end for
-    return path, path_params
+    return path.format_map(converted), remaining_params
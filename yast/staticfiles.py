@@ -7,39 +7,66 @@ description:
 author: emryslou@gmail.com
 """
 
-
+import calendar
 import functools
 import os
+import posixpath
 import stat
+import time
 import typing
 from email.utils import parsedate
 
-from aiofiles.os import stat as aio_stat
-
+from yast.concurrency import run_in_threadpool
 from yast.datastructures import Headers
-from yast.responses import FileResponse, PlainTextResponse, Response
+from yast.responses import (
+    ZERO_COPY_SEND,
+    FileResponse,
+    PlainTextResponse,
+    Response,
+)
 from yast.types import ASGIInstance, Receive, Scope, Send
 
 
 class NotModifiedResponse(Response):
-    NOT_MODIFIED_HEADERS = (
-        "cache-control",
-        "content-location",
-        "date",
-        "etag",
-        "expires",
-        "vary",
+    NOT_MODIFIED_HEADERS = frozenset(
+        (
+            "cache-control",
+            "content-location",
+            "date",
+            "etag",
+            "expires",
+            "vary",
+        )
     )
 
     def __init__(self, headers: Headers) -> None:
-        return super().__init__(
-            status_code=304,
-            headers={
-                name: value
-                for name, value in headers.items()
-                if name in self.NOT_MODIFIED_HEADERS
-            },
-        )
+        super().__init__(status_code=304)
+        # filter the raw pairs, no decoding and encoding back again
+        self.raw_headers = [
+            (name, value)
+            for name, value in headers.raw
+            if name in NOT_MODIFIED_RAW_HEADERS
+        ]
+
+
+NOT_MODIFIED_RAW_HEADERS = frozenset(
+    name.encode("latin-1") for name in NotModifiedResponse.NOT_MODIFIED_HEADERS
+)
+
+
+ALLOWED_METHODS = frozenset(("GET", "HEAD"))
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_http_date(value: str) -> typing.Optional[int]:
+    """
+    clients send back the same dates over and over,
+    remember them as plain timestamps
+    """
+    parsed = parsedate(value)
+    if parsed is None:
+        return None
+    return calendar.timegm(parsed)
 
 
 class StaticFiles(object):
@@ -49,11 +76,18 @@ class StaticFiles(object):
         directory: str = None,
         packages: typing.List[str] = None,
         check_dir: bool = True,
+        stat_cache_ttl: float = 0,
+        sync_stat: bool = True,
+        use_sendfile: bool = True,
     ) -> None:
         self.directory = directory
         self.packages = packages
         self.all_directories = self.get_directories(directory, packages)
         self.config_checked = False
+        self.stat_cache_ttl = stat_cache_ttl
+        self.sync_stat = sync_stat
+        self.use_sendfile = use_sendfile
+        self._stat_cache = {}
 
         if directory is not None and check_dir:
             assert os.path.isdir(directory), f'Directory "{directory}" does not exists'
@@ -86,10 +120,13 @@ class StaticFiles(object):
     def __call__(self, scope: Scope) -> ASGIInstance:
         assert scope["type"] == "http"
 
-        if scope["method"] not in ("GET", "HEAD"):
+        if scope["method"] not in ALLOWED_METHODS:
             return PlainTextResponse("Method Not Allowed", status_code=405)
 
-        path = os.path.normpath(os.path.join(*scope["path"].split("/")))
+        path = posixpath.normpath(scope["path"].lstrip("/"))
+        if os.path is not posixpath:
+            # e.g. windows, where a backslash separates too and can climb out
+            path = os.path.normpath(path)
         if path.startswith(".."):
             return PlainTextResponse("Not Found", status_code=404)
         return functools.partial(self.asgi, scope=scope, path=path)
@@ -102,53 +139,101 @@ class StaticFiles(object):
         method = scope["method"]
         headers = Headers(scope=scope)
         res = await self.get_response(path, method, headers)
+        if (
+            self.use_sendfile
+            and isinstance(res, FileResponse)
+            and ZERO_COPY_SEND in scope.get("extensions", {})
+        ):
+            res.zero_copy = True
 
         await res(receive, send)
 
     async def get_response(
         self, path: str, method: str, request_headers: Headers
     ) -> Response:
-        stat_result = None
+        found = await self.lookup_path(path)
+        if found is None:
+            return PlainTextResponse("Not Found", status_code=404)
+
+        full_path, stat_result = found
+        res = FileResponse(full_path, stat_result=stat_result, method=method)
+        if self.is_not_modified(res.headers, request_headers):
+            return NotModifiedResponse(res.headers)
+
+        return res
+
+    async def lookup_path(
+        self, path: str
+    ) -> typing.Optional[typing.Tuple[str, os.stat_result]]:
+        """
+        with `stat_cache_ttl` > 0 files found are remembered for that many
+        seconds, misses are never cached; a file rewritten or removed within
+        the ttl is served with stale headers, so only turn it on for
+        immutable assets
+        """
+        now = time.monotonic()
+        if self.stat_cache_ttl > 0:
+            cached = self._stat_cache.get(path)
+            if cached is not None and now - cached[0] < self.stat_cache_ttl:
+                return cached[1]
+
         for directory in self.all_directories:
             full_path = os.path.join(directory, path)
             try:
-                stat_result = await aio_stat(full_path)
+                stat_result = await self.stat_path(full_path)
             except FileNotFoundError:
-                pass
-            else:
+                continue
+
+            if not stat.S_ISREG(stat_result.st_mode):
                 break
 
-        if stat_result is None or not os.path.isfile(full_path):
-            return PlainTextResponse("Not Found", status_code=404)
+            found = (full_path, stat_result)
+            if self.stat_cache_ttl > 0:
+                self._stat_cache[path] = (now, found)
+            return found
+        # endfor
 
-        res = FileResponse(full_path, stat_result=stat_result, method=method)
-        if self.is_not_modified(res.headers, request_headers):
-            return NotModifiedResponse(res.headers)
+        self._stat_cache.pop(path, None)
+        return None
 
-        return res
+    async def stat_path(self, path: str) -> os.stat_result:
+        """
+        a stat on local disk is quicker than a threadpool round trip,
+        use `sync_stat=False` for slow filesystems, like nfs
+        """
+        if self.sync_stat:
+            return os.stat(path)
+        return await run_in_threadpool(os.stat, path)
 
     def is_not_modified(
         self, response_headers: Headers, request_headers: Headers
     ) -> bool:
-        try:
-            if_none_match = request_headers["if-none-match"]
-            etag = response_headers["etag"]
-            if if_none_match == etag:
+        # one pass over the raw request headers, first value wins
+        if_none_match = if_modified_since = None
+        for key, value in request_headers.raw:
+            if key == b"if-none-match":
+                if if_none_match is None:
+                    if_none_match = value.decode("latin-1")
+            elif key == b"if-modified-since":
+                if if_modified_since is None:
+                    if_modified_since = value.decode("latin-1")
+        # endfor
+
+        if if_none_match is not None:
+            if if_none_match == response_headers.get("etag"):
                 return True
-        except KeyError:
-            pass
 
-        try:
-            if_modified_since = parsedate(request_headers["if-modified-since"])
-            last_modified = parsedate(response_headers["last-modified"])
-            if (
-                if_modified_since is not None
-                and last_modified is not None
-                and if_modified_since >= last_modified
-            ):
-                return True
-        except KeyError:
-            pass
+        if if_modified_since is not None:
+            last_modified = response_headers.get("last-modified")
+            if last_modified is not None:
+                if_modified_since = parse_http_date(if_modified_since)
+                last_modified = parse_http_date(last_modified)
+                if (
+                    if_modified_since is not None
+                    and last_modified is not None
+                    and if_modified_since >= last_modified
+                ):
+                    return True
 
         return False
 
@@ -157,7 +242,7 @@ class StaticFiles(object):
             return
 
         try:
-            stat_result = await aio_stat(self.directory)
+            stat_result = await self.stat_path(self.directory)
         except FileNotFoundError:
             raise RuntimeWarning(
                 f"StaticFile directory `{self.directory}` does not exists"
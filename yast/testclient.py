@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import http
 import io
 import json
@@ -38,11 +39,46 @@ class _Upgrade(Exception):
         self.session = session
 
 
+_DEFAULT_PORTS = {"http": 80, "https": 443, "ws": 80, "wss": 443}
+_REASON_PHRASES = {status.value: status.phrase for status in http.HTTPStatus}
+
+
 def _get_reason_phrase(status_code):
-    try:
-        return http.HTTPStatus(status_code).phrase
-    except ValueError:
-        return ""
+    return _REASON_PHRASES.get(status_code, "")
+
+
+@functools.lru_cache(maxsize=64)
+def _split_netloc(scheme: str, netloc: str) -> typing.Tuple[str, int, bytes]:
+    """host, port and the encoded host header, a suite hits only a few netlocs"""
+    default_port = _DEFAULT_PORTS[scheme]
+
+    if ":" in netloc:
+        host, port = netloc.split(":", 1)
+        port = int(port)
+    else:
+        host = netloc
+        port = default_port
+
+    if port == default_port:
+        host_header = host.encode()
+    else:
+        host_header = (f"{host}:{port}").encode()
+    return host, port, host_header
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_header_key(key: str) -> bytes:
+    return key.lower().encode()
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_headers(
+    items: typing.Tuple[typing.Tuple[str, str], ...],
+) -> typing.Tuple[typing.Tuple[bytes, bytes], ...]:
+    """a client mostly sends the same headers again and again"""
+    # a miss is usually just one changed value (e.g. content-length),
+    # the keys themselves still come from the per-key cache
+    return tuple((_encode_header_key(key), value.encode()) for key, value in items)
 
 
 class _ASGIAdapter(requests.adapters.HTTPAdapter):
@@ -53,28 +89,16 @@ class _ASGIAdapter(requests.adapters.HTTPAdapter):
     def send(self, request, *args, **kwargs):
         scheme, netloc, path, query, fragement = urlsplit(request.url)
 
-        default_port = {"http": 80, "https": 443, "ws": 80, "wss": 443}[scheme]
-
-        if ":" in netloc:
-            host, port = netloc.split(":", 1)
-            port = int(port)
-        else:
-            host = netloc
-            port = default_port
+        host, port, host_header = _split_netloc(scheme, netloc)
 
         # Include the 'host' header.
         if "host" in request.headers:
             headers = []
-        elif port == default_port:
-            headers = [[b"host", host.encode()]]
         else:
-            headers = [[b"host", (f"{host}:{port}").encode()]]
+            headers = [(b"host", host_header)]
 
         # Include other request headers.
-        headers += [
-            [key.lower().encode(), value.encode()]
-            for key, value in request.headers.items()
-        ]
+        headers += _encode_headers(tuple(request.headers.items()))
 
         if scheme in {"ws", "wss"}:
             subprotocol = request.headers.get("sec-websocket-protocol", None)
@@ -113,10 +137,9 @@ class _ASGIAdapter(requests.adapters.HTTPAdapter):
         }
 
         async def receive():
-            nonlocal request_complete, response_complete
+            nonlocal request_complete
             if request_complete:
-                while not response_complete:
-                    await asyncio.sleep(0.0001)
+                await response_done.wait()
                 return {"type": "http.disconnect"}
 
             body = request.body
@@ -170,11 +193,12 @@ class _ASGIAdapter(requests.adapters.HTTPAdapter):
                 body = message.get("body", b"")
                 more_body = message.get("more_body", False)
                 if request.method != "HEAD":
-                    raw_kwargs["body"].write(body)
+                    body_chunks.append(body)
 
                 if not more_body:
-                    raw_kwargs["body"].seek(0)
+                    raw_kwargs["body"] = io.BytesIO(b"".join(body_chunks))
                     response_complete = True
+                    response_done.set()
             elif message["type"] == "http.response.template":
                 template = message["template"]
                 context = message["context"]
@@ -183,10 +207,12 @@ class _ASGIAdapter(requests.adapters.HTTPAdapter):
         response_started = False
         response_complete = False
         raw_kwargs = {"body": io.BytesIO()}
+        body_chunks = []
         template = None
         context = None
 
         loop = asyncio.get_event_loop()
+        response_done = asyncio.Event()
         try:
             connection = self.app(scope)
             loop.run_until_complete(connection(receive, send))
@@ -220,8 +246,8 @@ class WebSocketTestSession(object):
         self.accepted_subprotocol = None
         self._loop = asyncio.new_event_loop()
         self._instance = app(scope)
-        self._receive_queue = queue.Queue()
-        self._send_queue = queue.Queue()
+        self._receive_queue = queue.SimpleQueue()
+        self._send_queue = queue.SimpleQueue()
         self._thread = threading.Thread(target=self._run)
         self.send({"type": "websocket.connect"})
         self._thread.start()
@@ -236,8 +262,11 @@ class WebSocketTestSession(object):
     def __exit__(self, *args):
         self.close(1000)
         self._thread.join()
-        while not self._send_queue.empty():
-            message = self.receive()
+        while True:
+            try:
+                message = self._send_queue.get_nowait()
+            except queue.Empty:
+                break
             if isinstance(message, BaseException):
                 raise message  # pragma: nocover
 
@@ -248,6 +277,8 @@ class WebSocketTestSession(object):
             self._loop.run_until_complete(task)
         except BaseException as exc:
             self.__sput(exc)
+        finally:
+            self._loop.close()
 
     async def _asgi_receive(self):
         msg = self._receive_queue.get()
@@ -303,6 +334,15 @@ class WebSocketTestSession(object):
         self._send_queue.put(message)
 
 
+class RawResponse(typing.NamedTuple):
+    """what `TestClient.raw_request` returns"""
+
+    status_code: int
+    # the (name, value) byte pairs exactly as the app sent them
+    headers: typing.List[typing.Tuple[bytes, bytes]]
+    content: bytes
+
+
 class TestClient(requests.Session):
     __test__ = False
 
@@ -326,6 +366,63 @@ class TestClient(requests.Session):
         url = urljoin(self.base_url, url)
         return super().request(method, url, **kwargs)
 
+    def raw_request(
+        self,
+        method: str,
+        path: str,
+        body: bytes = b"",
+        headers: typing.Sequence[typing.Tuple[bytes, bytes]] = (),
+    ) -> RawResponse:
+        """
+        call the app directly, without the requests/urllib3 round trip;
+        see `RawResponse` for what comes back
+        """
+        scheme, netloc, *_ = urlsplit(self.base_url)
+        host, port, host_header = _split_netloc(scheme, netloc)
+        path, _, query = path.partition("?")
+        scope = {
+            "type": "http",
+            "http_version": "1.1",
+            "method": method.upper(),
+            "path": unquote(path),
+            "root_path": "",
+            "scheme": scheme,
+            "query_string": query.encode(),
+            "headers": [(b"host", host_header), *headers],
+            "client": ["testclient", 50000],
+            "server": [host, port],
+            "extensions": {},
+        }
+        status_code = None
+        raw_headers = []
+        body_chunks = []
+        request_complete = False
+
+        async def receive():
+            nonlocal request_complete
+            if request_complete:
+                await response_done.wait()
+                return {"type": "http.disconnect"}
+            request_complete = True
+            return {"type": "http.request", "body": body}
+
+        async def send(message):
+            nonlocal status_code, raw_headers
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                raw_headers = [(key, value) for key, value in message["headers"]]
+            elif message["type"] == "http.response.body":
+                if method.upper() != "HEAD":
+                    body_chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    response_done.set()
+
+        loop = asyncio.get_event_loop()
+        response_done = asyncio.Event()
+        loop.run_until_complete(self.app(scope)(receive, send))
+        assert status_code is not None, "TestClient did not receive any response"
+        return RawResponse(status_code, raw_headers, b"".join(body_chunks))
+
     def wsconnect(self, url: str, subprotocols=None, **kwargs) -> WebSocketTestSession:
         url = urljoin("ws://testserver", url)
         headers = kwargs.get("headers", {})
@@ -14,8 +14,8 @@ def get_plugin_middlewares(
     module = importlib.import_module(module_name)
 
     middlewares = {
-        attr.replace("Middleware", "").lower(): getattr(module, attr)
-        for attr in module.__dir__()
+        attr.replace("Middleware", "").lower(): value
+        for attr, value in vars(module).items()
         if attr.endswith("Middleware")
     }
 
@@ -5,6 +5,9 @@ import typing
 from yast.requests import HttpConnection
 from yast.types import Message, Receive, Scope, Send
 
+# compact, like JSONResponse, and built once instead of per message
+JSON_ENCODE = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
 
 class WebSocketState(enum.Enum):
     CONNECTING = 0
@@ -12,6 +15,12 @@ class WebSocketState(enum.Enum):
     DISCONNECTED = 2
 
 
+# enum member lookups go through the Enum metaclass, module globals do not
+_CONNECTING = WebSocketState.CONNECTING
+_CONNECTED = WebSocketState.CONNECTED
+_DISCONNECTED = WebSocketState.DISCONNECTED
+
+
 class WebSocketDisconnect(Exception):
     def __init__(self, code=1000):
         self.code = code
@@ -25,20 +34,21 @@ class WebSocket(HttpConnection):
         self._scope = scope
         self._receive = receive
         self._send = send
-        self.client_state = WebSocketState.CONNECTING
-        self.application_state = WebSocketState.CONNECTING
+        self.client_state = _CONNECTING
+        self.application_state = _CONNECTING
 
     async def receive(self) -> Message:
-        if self.client_state == WebSocketState.CONNECTING:
+        client_state = self.client_state
+        if client_state is _CONNECTING:
             message = await self._receive()
             assert message["type"] == "websocket.connect"
-            self.client_state = WebSocketState.CONNECTED
+            self.client_state = _CONNECTED
             return message
-        elif self.client_state == WebSocketState.CONNECTED:
+        elif client_state is _CONNECTED:
             message = await self._receive()
             assert message["type"] in {"websocket.receive", "websocket.disconnect"}
             if message["type"] == "websocket.disconnect":
-                self.client_state = WebSocketState.DISCONNECTED
+                self.client_state = _DISCONNECTED
             return message
         else:
             raise RuntimeError(
@@ -46,26 +56,27 @@ class WebSocket(HttpConnection):
             )
 
     async def send(self, message: Message) -> None:
-        if self.application_state == WebSocketState.CONNECTING:
+        application_state = self.application_state
+        if application_state is _CONNECTING:
             assert message["type"] in {"websocket.accept", "websocket.close"}
 
             if message["type"] == "websocket.close":
-                self.application_state = WebSocketState.DISCONNECTED
+                self.application_state = _DISCONNECTED
             else:
-                self.application_state = WebSocketState.CONNECTED
+                self.application_state = _CONNECTED
             await self._send(message)
-        elif self.application_state == WebSocketState.CONNECTED:
+        elif application_state is _CONNECTED:
             assert message["type"] in {"websocket.send", "websocket.close"}
 
             if message["type"] == "websocket.close":
-                self.application_state = WebSocketState.DISCONNECTED
+                self.application_state = _DISCONNECTED
 
             await self._send(message)
         else:
             raise RuntimeError('Cannot call "send" once a close message has been sent.')
 
     async def accept(self, subprotocol: str = None) -> None:
-        if self.client_state == WebSocketState.CONNECTING:
+        if self.client_state is _CONNECTING:
             await self.receive()
         await self.send({"type": "websocket.accept", "subprotocol": subprotocol})
 
@@ -76,14 +87,14 @@ class WebSocket(HttpConnection):
             raise WebSocketDisconnect(message["code"])
 
     async def receive_text(self) -> str:
-        assert self.application_state == WebSocketState.CONNECTED
+        assert self.application_state is _CONNECTED
 
         message = await self.receive()
         self._raise_on_disconnect(message)
         return message["text"]
 
     async def receive_bytes(self) -> bytes:
-        assert self.application_state == WebSocketState.CONNECTED
+        assert self.application_state is _CONNECTED
 
         message = await self.receive()
         self._raise_on_disconnect(message)
@@ -99,8 +110,25 @@ class WebSocket(HttpConnection):
     async def send_bytes(self, data: bytes) -> None:
         await self.send({"type": "websocket.send", "bytes": data})
 
+    async def send_batch(
+        self, messages: typing.Iterable[typing.Union[str, bytes]]
+    ) -> None:
+        """
+        send several text/bytes frames, checking the state only once;
+        every frame is still its own `send` await, in order
+        """
+        if self.application_state is not _CONNECTED:
+            raise RuntimeError('Cannot call "send_batch" unless connected.')
+        send = self._send
+        for data in messages:
+            if isinstance(data, bytes):
+                await send({"type": "websocket.send", "bytes": data})
+            else:
+                await send({"type": "websocket.send", "text": data})
+        # endfor
+
     async def send_json(self, data) -> None:
-        _j = json.dumps(data).encode("utf-8")
+        _j = JSON_ENCODE(data).encode("utf-8")
         await self.send({"type": "websocket.send", "bytes": _j})
 
     async def close(self, code=1000) -> None:
@@ -108,6 +136,8 @@ class WebSocket(HttpConnection):
 
 
 class WebSocketClose(object):
+    __slots__ = ("code",)
+
     def __init__(self, code: int = 1000):
         self.code = code
 